@@ -1,30 +1,183 @@
-import datetime
-import json
-from enum import Enum
+import math
+import sys
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from enum import IntEnum
+from functools import lru_cache
 
-class DeviceCategory(Enum):
+# datetime, json and the optional numpy/numba/orjson accelerators are imported
+# where they are used, keeping them off the interactive startup path
+
+class DeviceCategory(IntEnum):
     """Categories of electronic devices on campus"""
-    LAPTOP = "Laptop"
-    LAB_EQUIPMENT = "Lab Equipment"
-    CONSUMABLE = "Consumable"
-    APPLIANCE = "Appliance"
-    PERIPHERAL = "Peripheral"
+    LAPTOP = 1
+    LAB_EQUIPMENT = 2
+    CONSUMABLE = 3
+    APPLIANCE = 4
+    PERIPHERAL = 5
+
+CATEGORY_LABEL = {
+    DeviceCategory.LAPTOP: "Laptop",
+    DeviceCategory.LAB_EQUIPMENT: "Lab Equipment",
+    DeviceCategory.CONSUMABLE: "Consumable",
+    DeviceCategory.APPLIANCE: "Appliance",
+    DeviceCategory.PERIPHERAL: "Peripheral",
+}
 
-class DisposalStrategy(Enum):
+_CATEGORY_BY_LABEL = {label.lower(): category for category, label in CATEGORY_LABEL.items()}
+
+class DisposalStrategy(IntEnum):
     """Possible end-of-life strategies for devices"""
-    RELOCATE = "Relocate to Permanent Campus"
-    REPURPOSE = "Repurpose/Upcycle for Labs"
-    MARKETPLACE = "Sell on Marketplace"
-    STRIP_COMPONENTS = "Strip for Components"
-    RECYCLE = "Responsible Recycling"
-    HAZARDOUS_DISPOSAL = "Hazardous Material Disposal"
+    RELOCATE = 1
+    REPURPOSE = 2
+    MARKETPLACE = 3
+    STRIP_COMPONENTS = 4
+    RECYCLE = 5
+    HAZARDOUS_DISPOSAL = 6
+
+DISPOSAL_LABEL = {
+    DisposalStrategy.RELOCATE: "Relocate to Permanent Campus",
+    DisposalStrategy.REPURPOSE: "Repurpose/Upcycle for Labs",
+    DisposalStrategy.MARKETPLACE: "Sell on Marketplace",
+    DisposalStrategy.STRIP_COMPONENTS: "Strip for Components",
+    DisposalStrategy.RECYCLE: "Responsible Recycling",
+    DisposalStrategy.HAZARDOUS_DISPOSAL: "Hazardous Material Disposal",
+}
+
+def _parse_category(category):
+    """Map a category label or code to its DeviceCategory; anything else is kept as-is"""
+    if isinstance(category, DeviceCategory):
+        return category
+    if isinstance(category, str):
+        return _CATEGORY_BY_LABEL.get(category.lower()) or sys.intern(category)
+    # bool is an int subclass, but True is not a category code
+    if isinstance(category, int) and not isinstance(category, bool):
+        try:
+            return DeviceCategory(category)
+        except ValueError:
+            return category
+    return category
+
+def _category_label(category):
+    """Display text for a stored category"""
+    return CATEGORY_LABEL.get(category, category)
+
+# Asset fields that _strategy_for depends on
+STRATEGY_FIELDS = frozenset({'age_years', 'battery_health', 'can_refurbish',
+                             'is_hazardous', 'category'})
+
+@lru_cache(maxsize=4096)
+def _strategy_for(is_hazardous, age_years, battery_health, can_refurbish, category):
+    """Pick the end-of-life strategy for a device (memoized, inputs repeat a lot)"""
+    
+    # Hazardous materials need special handling
+    if is_hazardous:
+        return DisposalStrategy.HAZARDOUS_DISPOSAL
+    
+    # Refurbishable devices are the bulk of the inventory, so they are
+    # tested first, most frequent outcome on the outer branch
+    if can_refurbish:
+        # Refurbishable devices with moderate age
+        if age_years < 5 and battery_health > 40:
+            # Young devices with good battery health
+            if age_years < 3 and battery_health > 70:
+                return DisposalStrategy.RELOCATE
+            return DisposalStrategy.MARKETPLACE
+        
+        # Lab equipment that can be repurposed
+        if category == DeviceCategory.LAB_EQUIPMENT:
+            return DisposalStrategy.REPURPOSE
+        return DisposalStrategy.RECYCLE
+    
+    # Devices that can be stripped for components
+    if age_years < 7:
+        return DisposalStrategy.STRIP_COMPONENTS
+    
+    # Everything else goes to recycling
+    return DisposalStrategy.RECYCLE
+
+@lru_cache(maxsize=None)
+def _bulk_backend():
+    """Import the bulk evaluation libraries on first use: (numpy, compiled kernel)"""
+    try:
+        import numpy as np
+    except ImportError:  # bulk_add falls back to per-asset evaluation
+        return None, None
+    try:
+        from numba import njit, prange
+    except ImportError:  # bulk_add uses the NumPy masks instead
+        return np, None
+    
+    @njit(cache=True, parallel=True)
+    def bulk_strategy_kernel(hazard, age, battery, refurb, category, out):
+        """Compiled _strategy_for over arrays, writing strategy codes into out"""
+        for i in prange(age.shape[0]):
+            if hazard[i]:
+                out[i] = DisposalStrategy.HAZARDOUS_DISPOSAL
+            elif refurb[i]:
+                if age[i] < 5 and battery[i] > 40:
+                    if age[i] < 3 and battery[i] > 70:
+                        out[i] = DisposalStrategy.RELOCATE
+                    else:
+                        out[i] = DisposalStrategy.MARKETPLACE
+                elif category[i] == DeviceCategory.LAB_EQUIPMENT:
+                    out[i] = DisposalStrategy.REPURPOSE
+                else:
+                    out[i] = DisposalStrategy.RECYCLE
+            elif age[i] < 7:
+                out[i] = DisposalStrategy.STRIP_COMPONENTS
+            else:
+                out[i] = DisposalStrategy.RECYCLE
+    
+    return np, bulk_strategy_kernel
+
+def _bulk_strategies(is_hazardous, age_years, battery_health, can_refurbish, category):
+    """Evaluate strategies for parallel sequences of device attributes at once"""
+    np, kernel = _bulk_backend()
+    if np is None:
+        return [_strategy_for(*row) for row in zip(is_hazardous, age_years, battery_health,
+                                                   can_refurbish, category)]
+    
+    hazard = np.asarray(is_hazardous, dtype=bool)
+    age = np.asarray(age_years, dtype=float)
+    battery = np.asarray(battery_health, dtype=float)
+    refurb = np.asarray(can_refurbish, dtype=bool)
+    # Free-form categories have no DeviceCategory member and are coded as 0
+    codes = np.array([c if isinstance(c, DeviceCategory) else 0 for c in category],
+                     dtype=np.int8)
+    # The compiled kernel indexes every array by position without bounds checks
+    if len({hazard.shape, age.shape, battery.shape, refurb.shape, codes.shape}) > 1:
+        raise ValueError("bulk strategy inputs must all have the same shape")
+    
+    if kernel is not None:
+        out = np.empty(len(age), dtype=np.int8)
+        kernel(hazard, age, battery, refurb, codes, out)
+    else:
+        # Masks are applied from lowest to highest precedence so that later
+        # writes win, mirroring the if/elif ladder in _strategy_for
+        out = np.full(len(age), DisposalStrategy.RECYCLE, dtype=np.int8)
+        out[~refurb & (age < 7)] = DisposalStrategy.STRIP_COMPONENTS
+        out[refurb & (codes == DeviceCategory.LAB_EQUIPMENT)] = DisposalStrategy.REPURPOSE
+        out[refurb & (age < 5) & (battery > 40)] = DisposalStrategy.MARKETPLACE
+        out[refurb & (age < 3) & (battery > 70)] = DisposalStrategy.RELOCATE
+        out[hazard] = DisposalStrategy.HAZARDOUS_DISPOSAL
+    return list(map(DisposalStrategy, out.tolist()))
 
 class CampusAsset:
     """Represents a single electronic device or equipment on campus"""
     
+    __slots__ = ('asset_id', '_name', '_name_lower', '_model', '_category',
+                 '_age_years', '_battery_health', 'can_refurbish', 'is_hazardous',
+                 '_status', 'location', 'last_used', '_disposal_strategy', '_str',
+                 '_inventory')
+    
     def __init__(self, asset_id, name, model, category, age_years, 
-                 battery_health=100, can_refurbish=True, is_hazardous=False):
+                 battery_health=100, can_refurbish=True, is_hazardous=False,
+                 disposal_strategy=None):
         self.asset_id = asset_id
+        # Set by the CampusInventory holding this asset, so that changes made
+        # on the asset itself keep its indexes in sync
+        self._inventory = None
         self.name = name
         self.model = model
         self.category = category
@@ -35,39 +188,105 @@ class CampusAsset:
         self.status = "Dormant"
         self.location = "Storage"
         self.last_used = None
-        self.disposal_strategy = self.evaluate_disposal_strategy()
+        self._str = None
+        # Callers that already evaluated the strategy (bulk imports) pass it in
+        if disposal_strategy is None:
+            disposal_strategy = self.evaluate_disposal_strategy()
+        self.disposal_strategy = disposal_strategy
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        # Interned, with the lowercase form cached for case-insensitive lookups
+        self._detach('name')
+        self._name = sys.intern(value)
+        self._name_lower = sys.intern(self._name.lower())
+        self._attach('name')
+
+    @property
+    def model(self):
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._model = sys.intern(value)
+        self._str = None
+
+    @property
+    def category(self):
+        return self._category
+
+    @category.setter
+    def category(self, value):
+        # Known labels are stored as DeviceCategory, anything else as text
+        self._detach('category')
+        self._category = _parse_category(value)
+        self._attach('category')
+
+    @property
+    def age_years(self):
+        return self._age_years
+
+    @age_years.setter
+    def age_years(self, value):
+        self._detach('age_years')
+        self._age_years = value
+        self._attach('age_years')
+
+    @property
+    def battery_health(self):
+        return self._battery_health
+
+    @battery_health.setter
+    def battery_health(self, value):
+        self._detach('battery_health')
+        self._battery_health = value
+        self._attach('battery_health')
+
+    @property
+    def disposal_strategy(self):
+        return self._disposal_strategy
+
+    @disposal_strategy.setter
+    def disposal_strategy(self, value):
+        self._detach('disposal_strategy')
+        self._disposal_strategy = value
+        self._attach('disposal_strategy')
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._detach('status')
+        self._status = value
+        self._attach('status')
+
+    def _detach(self, field):
+        """Take the asset out of its inventory's indexes before field changes"""
+        if self._inventory is not None:
+            self._inventory._unindex_asset(self, {field})
+
+    def _attach(self, field):
+        """Re-index the asset after field changed and drop the cached __str__"""
+        self._str = None
+        if self._inventory is not None:
+            self._inventory._index_asset(self, {field})
 
     def evaluate_disposal_strategy(self):
         """AI-driven logic to determine the best end-of-life strategy"""
-        
-        # Hazardous materials need special handling
-        if self.is_hazardous:
-            return DisposalStrategy.HAZARDOUS_DISPOSAL
-        
-        # Young devices with good battery health
-        if self.age_years < 3 and self.battery_health > 70 and self.can_refurbish:
-            return DisposalStrategy.RELOCATE
-        
-        # Refurbishable devices with moderate age
-        elif self.can_refurbish and self.age_years < 5 and self.battery_health > 40:
-            return DisposalStrategy.MARKETPLACE
-        
-        # Lab equipment that can be repurposed
-        elif self.category == DeviceCategory.LAB_EQUIPMENT.value and self.can_refurbish:
-            return DisposalStrategy.REPURPOSE
-        
-        # Devices that can be stripped for components
-        elif not self.can_refurbish and self.age_years < 7:
-            return DisposalStrategy.STRIP_COMPONENTS
-        
-        # Everything else goes to recycling
-        else:
-            return DisposalStrategy.RECYCLE
+        return _strategy_for(self.is_hazardous, self.age_years, self.battery_health,
+                             self.can_refurbish, self.category)
 
     def update_status(self, new_status):
         """Update the current status of the asset"""
         self.status = new_status
         if new_status == "In Use":
+            import datetime
             self.last_used = datetime.datetime.now()
 
     def to_dict(self):
@@ -76,31 +295,63 @@ class CampusAsset:
             'asset_id': self.asset_id,
             'name': self.name,
             'model': self.model,
-            'category': self.category,
+            'category': _category_label(self.category),
             'age_years': self.age_years,
             'battery_health': self.battery_health,
             'can_refurbish': self.can_refurbish,
             'is_hazardous': self.is_hazardous,
             'status': self.status,
             'location': self.location,
-            'disposal_strategy': self.disposal_strategy.value
+            'disposal_strategy': DISPOSAL_LABEL[self.disposal_strategy]
         }
 
     def __str__(self):
-        return (f"ID: {self.asset_id} | {self.name} ({self.model}) | "
-                f"Category: {self.category} | Age: {self.age_years}yr | "
-                f"Battery: {self.battery_health}% | Status: {self.status} | "
-                f"Strategy: {self.disposal_strategy.value}")
+        # Cached until one of the displayed fields is assigned
+        if self._str is None:
+            self._str = (f"ID: {self.asset_id} | {self.name} ({self.model}) | "
+                         f"Category: {_category_label(self.category)} | Age: {self.age_years}yr | "
+                         f"Battery: {self.battery_health}% | Status: {self.status} | "
+                         f"Strategy: {DISPOSAL_LABEL[self.disposal_strategy]}")
+        return self._str
+
+
+def _json_default(obj):
+    """Encode inventory objects on the fly while exporting to JSON"""
+    if isinstance(obj, CampusAsset):
+        data = obj.to_dict()
+        # NaN/infinity are not valid JSON; both encoders write them as null
+        for key, value in data.items():
+            if isinstance(value, float) and not math.isfinite(value):
+                data[key] = None
+        return data
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class CampusInventory:
     """Central inventory management system for all campus assets"""
     
+    # Asset fields with a hash index for search_assets
+    INDEXED_FIELDS = ('name', 'status', 'category', 'disposal_strategy')
+    # Number of distinct search_assets queries remembered between changes
+    SEARCH_CACHE_SIZE = 128
+    
     def __init__(self):
         self.assets = {}
         self.next_id = 1
-        self.marketplace_items = []
+        # Used as an ordered set: O(1) membership and removal, listing order kept
+        self.marketplace_items = {}
         self.components_library = []
+        # Lookup indexes kept in sync with self.assets. Buckets are dicts used
+        # as insertion-ordered sets, so results come out without sorting
+        self._by_name_cat = defaultdict(dict)
+        self._idx = {field: defaultdict(dict) for field in self.INDEXED_FIELDS}
+        self._by_strategy = self._idx['disposal_strategy']
+        # Sorted (value, asset_id) pairs for ordered views
+        self._by_age = []
+        self._by_battery = []
+        # Recent search_assets results (criteria -> asset IDs), least recent
+        # first; emptied whenever the inventory changes
+        self._search_cache = OrderedDict()
 
     def add_asset(self, name, model, category, age_years, 
                   battery_health=100, can_refurbish=True, is_hazardous=False):
@@ -114,33 +365,132 @@ class CampusInventory:
         )
         
         self.assets[asset_id] = asset
+        asset._inventory = self
+        self._index_asset(asset)
         
         # Auto-process based on disposal strategy
         self._process_asset(asset)
         
         print(f"✓ SUCCESS: {asset.name} ({asset_id}) added to Circularity Engine.")
-        print(f"  → Disposal Strategy: {asset.disposal_strategy.value}")
+        print(f"  → Disposal Strategy: {DISPOSAL_LABEL[asset.disposal_strategy]}")
         return asset_id
 
+    def bulk_add(self, names, models, categories, ages, battery_healths,
+                 can_refurbish, is_hazardous):
+        """Add many assets at once from parallel sequences (e.g. a CSV import)"""
+        # NumPy arrays become lists of plain Python values, so assets never
+        # hold numpy scalars (which the JSON export cannot encode)
+        names, models, categories, ages, battery_healths, can_refurbish, is_hazardous = (
+            values.tolist() if hasattr(values, 'tolist') else list(values)
+            for values in (names, models, categories, ages, battery_healths,
+                           can_refurbish, is_hazardous)
+        )
+        if len({len(names), len(models), len(categories), len(ages), len(battery_healths),
+                len(can_refurbish), len(is_hazardous)}) > 1:
+            raise ValueError("bulk_add sequences must all have the same length")
+        categories = [_parse_category(category) for category in categories]
+        strategies = _bulk_strategies(is_hazardous, ages, battery_healths,
+                                      can_refurbish, categories)
+        
+        asset_ids = []
+        for name, model, category, age_years, battery_health, refurb, hazard, strategy in zip(
+                names, models, categories, ages, battery_healths,
+                can_refurbish, is_hazardous, strategies):
+            asset_id = f"ASSET-{self.next_id:04d}"
+            self.next_id += 1
+            
+            asset = CampusAsset(
+                asset_id, name, model, category, age_years,
+                battery_health, refurb, hazard, strategy
+            )
+            
+            self.assets[asset_id] = asset
+            asset._inventory = self
+            self._index_asset(asset, set(self.INDEXED_FIELDS))
+            if strategy == DisposalStrategy.MARKETPLACE:
+                self.marketplace_items[asset_id] = None
+            asset_ids.append(asset_id)
+        
+        # One sort per view is cheaper than an insort per asset
+        for entries, field in ((self._by_age, 'age_years'), (self._by_battery, 'battery_health')):
+            values = ((getattr(self.assets[aid], field), aid) for aid in asset_ids)
+            entries.extend(entry for entry in values if entry[0] == entry[0])
+            entries.sort()
+        
+        print(f"✓ SUCCESS: {len(asset_ids)} assets added to Circularity Engine.")
+        return asset_ids
+
     def _process_asset(self, asset):
         """Process asset based on its disposal strategy"""
         if asset.disposal_strategy == DisposalStrategy.MARKETPLACE:
-            self.marketplace_items.append(asset.asset_id)
+            self.marketplace_items[asset.asset_id] = None
             print(f"  → Added to marketplace for sale/exchange")
         elif asset.disposal_strategy == DisposalStrategy.STRIP_COMPONENTS:
             print(f"  → Scheduled for component extraction")
         elif asset.disposal_strategy == DisposalStrategy.HAZARDOUS_DISPOSAL:
             print(f"  ⚠ HAZARDOUS: Special disposal protocol required")
 
+    def _index_asset(self, asset, fields=None):
+        """Register asset in the lookup indexes (only those keyed on fields, if given)"""
+        self._search_cache.clear()
+        if fields is None or not fields.isdisjoint(('name', 'category')):
+            self._by_name_cat[(asset._name_lower, asset.category)][asset.asset_id] = None
+        for field, index in self._idx.items():
+            if fields is None or field in fields:
+                index[getattr(asset, field)][asset.asset_id] = None
+        if fields is None or 'age_years' in fields:
+            self._insert_sorted(self._by_age, (asset.age_years, asset.asset_id))
+        if fields is None or 'battery_health' in fields:
+            self._insert_sorted(self._by_battery, (asset.battery_health, asset.asset_id))
+
+    def _unindex_asset(self, asset, fields=None):
+        """Remove asset from the lookup indexes (only those keyed on fields, if given)"""
+        self._search_cache.clear()
+        if fields is None or not fields.isdisjoint(('name', 'category')):
+            self._discard(self._by_name_cat, (asset._name_lower, asset.category), asset.asset_id)
+        for field, index in self._idx.items():
+            if fields is None or field in fields:
+                self._discard(index, getattr(asset, field), asset.asset_id)
+        if fields is None or 'age_years' in fields:
+            self._remove_sorted(self._by_age, (asset.age_years, asset.asset_id))
+        if fields is None or 'battery_health' in fields:
+            self._remove_sorted(self._by_battery, (asset.battery_health, asset.asset_id))
+
+    @staticmethod
+    def _discard(index, key, asset_id):
+        """Drop asset_id from an index bucket, removing the bucket once empty"""
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(asset_id, None)
+            if not ids:
+                del index[key]
+
+    @staticmethod
+    def _insert_sorted(entries, entry):
+        """Insert a (value, asset_id) pair into a sorted view"""
+        # NaN cannot be ordered, so those assets are left out of the view
+        if entry[0] == entry[0]:
+            insort(entries, entry)
+
+    @staticmethod
+    def _remove_sorted(entries, entry):
+        """Remove a (value, asset_id) pair from a sorted view"""
+        if entry[0] != entry[0]:
+            return
+        i = bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            del entries[i]
+
     def delete_asset(self, asset_id):
         """Remove an asset from inventory"""
         if asset_id in self.assets:
             asset = self.assets[asset_id]
             del self.assets[asset_id]
+            self._unindex_asset(asset)
+            asset._inventory = None
             
             # Remove from marketplace if listed
-            if asset_id in self.marketplace_items:
-                self.marketplace_items.remove(asset_id)
+            self.marketplace_items.pop(asset_id, None)
             
             print(f"✓ DELETED: {asset.name} ({asset_id}) removed from inventory.")
             return True
@@ -157,15 +507,24 @@ class CampusInventory:
         asset = self.assets[asset_id]
         
         # Update allowed fields
+        # Private slots (caches, owner link) are not updatable fields
+        changed = {key for key in kwargs if not key.startswith('_') and hasattr(asset, key)}
+        # Status/location edits cannot change the strategy, so skip
+        # re-evaluating it and moving the asset between strategy buckets.
+        # The strategy itself is derived, so setting it directly re-evaluates.
+        reevaluate = 'disposal_strategy' in changed or not STRATEGY_FIELDS.isdisjoint(changed)
+        
+        # Indexed fields re-index themselves through their property setters
         for key, value in kwargs.items():
-            if hasattr(asset, key):
+            if key in changed:
                 setattr(asset, key, value)
         
         # Re-evaluate disposal strategy after updates
-        asset.disposal_strategy = asset.evaluate_disposal_strategy()
+        if reevaluate:
+            asset.disposal_strategy = asset.evaluate_disposal_strategy()
         
         print(f"✓ UPDATED: {asset.name} ({asset_id})")
-        print(f"  → New Strategy: {asset.disposal_strategy.value}")
+        print(f"  → New Strategy: {DISPOSAL_LABEL[asset.disposal_strategy]}")
         return True
 
     def get_asset(self, asset_id):
@@ -182,18 +541,76 @@ class CampusInventory:
             print("No devices found. Add assets to begin tracking.")
             return
         
-        for asset in self.assets.values():
-            print(asset)
+        # One write for the whole listing instead of a print per asset
+        sys.stdout.write("\n".join(map(str, self.assets.values())) + "\n")
         
         print(f"\nTotal Assets: {len(self.assets)}")
 
+    def oldest_assets(self, k):
+        """Return the k oldest assets, oldest first"""
+        if k <= 0:
+            return []
+        return [self.assets[aid] for _, aid in reversed(self._by_age[-k:])]
+
+    def weakest_battery_assets(self, k):
+        """Return the k assets with the lowest battery health, lowest first"""
+        if k <= 0:
+            return []
+        return [self.assets[aid] for _, aid in self._by_battery[:k]]
+
     def search_assets(self, **criteria):
         """Search assets by various criteria"""
-        results = []
+        if 'category' in criteria:
+            criteria['category'] = _parse_category(criteria['category'])
+        
+        # Only index-backed criteria are cached: the index hooks are what clear
+        # the cache, so writes to other fields would leave stale results
+        if not all(field in self._idx for field in criteria):
+            return self._search(criteria)
+        try:
+            key = frozenset(criteria.items())
+        except TypeError:
+            return self._search(criteria)
+        ids = self._search_cache.get(key)
+        if ids is not None:
+            self._search_cache.move_to_end(key)
+            return [self.assets[aid] for aid in ids]
+        
+        results = self._search(criteria)
+        self._search_cache[key] = tuple(asset.asset_id for asset in results)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return results
+
+    def _bucket(self, field, value):
+        """IDs indexed under value for field (none for unhashable values)"""
+        try:
+            return self._idx[field].get(value, {})
+        except TypeError:
+            return {}
+
+    def _search(self, criteria):
+        """Uncached search_assets: index intersection plus a direct check"""
+        # Walk the smallest indexed bucket, keeping the IDs found in the others
+        buckets = sorted((self._bucket(key, value)
+                          for key, value in criteria.items() if key in self._idx), key=len)
+        if buckets:
+            smallest, others = buckets[0], buckets[1:]
+            if others:
+                smallest = [aid for aid in smallest if all(aid in bucket for bucket in others)]
+            candidates = list(map(self.assets.__getitem__, smallest))
+        else:
+            candidates = self.assets.values()
         
-        for asset in self.assets.values():
+        # Fields without an index are checked directly on the candidates
+        remaining = [(key, value) for key, value in criteria.items() if key not in self._idx]
+        if not remaining:
+            return list(candidates)
+        
+        results = []
+        for asset in candidates:
             match = True
-            for key, value in criteria.items():
+            for key, value in remaining:
                 if hasattr(asset, key):
                     if getattr(asset, key) != value:
                         match = False
@@ -205,13 +622,14 @@ class CampusInventory:
 
     def check_procurement_prevention(self, device_name, device_category):
         """AI logic to prevent unnecessary purchases"""
+        # The query is lowercased once; asset names are stored pre-lowered and
+        # interned, so the index probe settles equality by identity
+        needle = sys.intern(device_name.lower())
+        
         # Find dormant devices of same type
-        dormant_matches = [
-            asset for asset in self.assets.values()
-            if asset.name.lower() == device_name.lower() 
-            and asset.status == "Dormant"
-            and asset.category == device_category
-        ]
+        ids = self._by_name_cat.get((needle, _parse_category(device_category)), ())
+        dormant = self._idx['status'].get("Dormant", ())
+        dormant_matches = [self.assets[aid] for aid in ids if aid in dormant]
         
         if dormant_matches:
             print(f"\n⚠ [AI ALERT] PROCUREMENT BLOCKED!")
@@ -236,12 +654,14 @@ class CampusInventory:
             print("No items currently listed.")
             return
         
+        lines = []
         for item_id in self.marketplace_items:
             asset = self.assets[item_id]
-            print(f"📱 {asset.name} ({asset.model})")
-            print(f"   Battery: {asset.battery_health}% | Age: {asset.age_years}yr | "
-                  f"Price: Calculate based on condition")
-            print()
+            lines.append(f"📱 {asset.name} ({asset.model})")
+            lines.append(f"   Battery: {asset.battery_health}% | Age: {asset.age_years}yr | "
+                         f"Price: Calculate based on condition")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def generate_migration_report(self):
         """Generate report for transition to permanent campus"""
@@ -249,32 +669,62 @@ class CampusInventory:
         print("MIGRATION READINESS REPORT - Transit to Permanent Campus")
         print("="*80)
         
-        strategies = {}
-        for asset in self.assets.values():
-            strategy = asset.disposal_strategy.value
-            if strategy not in strategies:
-                strategies[strategy] = []
-            strategies[strategy].append(asset)
-        
-        for strategy, assets in strategies.items():
-            print(f"\n{strategy}: {len(assets)} items")
-            for asset in assets:
-                print(f"  - {asset.asset_id}: {asset.name} ({asset.model})")
+        lines = []
+        for strategy in DisposalStrategy:
+            ids = self._by_strategy.get(strategy)
+            if not ids:
+                continue
+            lines.append(f"\n{DISPOSAL_LABEL[strategy]}: {len(ids)} items")
+            for aid in ids:
+                asset = self.assets[aid]
+                lines.append(f"  - {asset.asset_id}: {asset.name} ({asset.model})")
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def export_to_json(self, filename="inventory.json"):
         """Export inventory to JSON file"""
+        import datetime
+        
+        # Assets are encoded one at a time by _json_default rather than
+        # copied into an intermediate dict up front
         data = {
-            'assets': {aid: asset.to_dict() for aid, asset in self.assets.items()},
-            'marketplace': self.marketplace_items,
+            'assets': self.assets,
+            'marketplace': list(self.marketplace_items),
             'timestamp': datetime.datetime.now().isoformat()
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        try:
+            import orjson
+        except ImportError:  # fall back to the stdlib encoder
+            import json
+            # Raw UTF-8 rather than \u escapes, matching orjson's output
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+        else:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2))
         
         print(f"✓ Inventory exported to {filename}")
 
 
+MAIN_MENU = "\n".join([
+    "\n" + "="*80,
+    "NEAR-ZERO E-WASTE CAMPUS MANAGEMENT SYSTEM",
+    "="*80,
+    "1.  Add New Asset",
+    "2.  View All Assets",
+    "3.  Search Assets",
+    "4.  Update Asset",
+    "5.  Delete Asset",
+    "6.  Check Procurement (AI Prevention)",
+    "7.  View Marketplace",
+    "8.  Generate Migration Report",
+    "9.  Export Inventory to JSON",
+    "10. Exit",
+    "="*80,
+])
+
+
 def main_menu():
     """Interactive menu for the e-waste management system"""
     inventory = CampusInventory()
@@ -282,103 +732,97 @@ def main_menu():
     # Pre-populate with some sample data
     print("Initializing IIT Delhi - Abu Dhabi Near-Zero E-Waste System...\n")
     
-    while True:
-        print("\n" + "="*80)
-        print("NEAR-ZERO E-WASTE CAMPUS MANAGEMENT SYSTEM")
-        print("="*80)
-        print("1.  Add New Asset")
-        print("2.  View All Assets")
-        print("3.  Search Assets")
-        print("4.  Update Asset")
-        print("5.  Delete Asset")
-        print("6.  Check Procurement (AI Prevention)")
-        print("7.  View Marketplace")
-        print("8.  Generate Migration Report")
-        print("9.  Export Inventory to JSON")
-        print("10. Exit")
-        print("="*80)
-        
-        choice = input("\nEnter your choice (1-10): ").strip()
-        
-        if choice == "1":
-            # Add asset
-            print("\n--- Add New Asset ---")
-            name = input("Device Name: ")
-            model = input("Model: ")
-            print("Categories: Laptop, Lab Equipment, Consumable, Appliance, Peripheral")
-            category = input("Category: ")
-            age_years = float(input("Age (years): "))
-            battery_health = int(input("Battery Health % (0-100): "))
-            can_refurbish = input("Can Refurbish? (y/n): ").lower() == 'y'
-            is_hazardous = input("Contains Hazardous Materials? (y/n): ").lower() == 'y'
-            
-            inventory.add_asset(name, model, category, age_years, 
-                              battery_health, can_refurbish, is_hazardous)
-        
-        elif choice == "2":
-            inventory.list_all_assets()
-        
-        elif choice == "3":
-            print("\n--- Search Assets ---")
-            search_name = input("Search by name (or press Enter to skip): ")
-            search_status = input("Search by status (or press Enter to skip): ")
-            
-            criteria = {}
-            if search_name:
-                criteria['name'] = search_name
-            if search_status:
-                criteria['status'] = search_status
+    def add_asset():
+        print("\n--- Add New Asset ---")
+        name = input("Device Name: ")
+        model = input("Model: ")
+        print("Categories: " + ", ".join(CATEGORY_LABEL.values()))
+        category = input("Category: ")
+        age_years = float(input("Age (years): "))
+        battery_health = int(input("Battery Health % (0-100): "))
+        can_refurbish = input("Can Refurbish? (y/n): ").lower() == 'y'
+        is_hazardous = input("Contains Hazardous Materials? (y/n): ").lower() == 'y'
+        
+        inventory.add_asset(name, model, category, age_years, 
+                          battery_health, can_refurbish, is_hazardous)
+    
+    def search_assets():
+        print("\n--- Search Assets ---")
+        search_name = input("Search by name (or press Enter to skip): ")
+        search_status = input("Search by status (or press Enter to skip): ")
+        
+        criteria = {}
+        if search_name:
+            criteria['name'] = search_name
+        if search_status:
+            criteria['status'] = search_status
+        
+        results = inventory.search_assets(**criteria)
+        print(f"\nFound {len(results)} matching assets:")
+        for asset in results:
+            print(asset)
+    
+    def update_asset():
+        asset_id = input("\nEnter Asset ID to update: ")
+        asset = inventory.get_asset(asset_id)
+        
+        if asset:
+            print(f"Current: {asset}")
+            battery_health = input("New Battery Health (or Enter to skip): ")
+            status = input("New Status (or Enter to skip): ")
             
-            results = inventory.search_assets(**criteria)
-            print(f"\nFound {len(results)} matching assets:")
-            for asset in results:
-                print(asset)
-        
-        elif choice == "4":
-            asset_id = input("\nEnter Asset ID to update: ")
-            asset = inventory.get_asset(asset_id)
+            updates = {}
+            if battery_health:
+                updates['battery_health'] = int(battery_health)
+            if status:
+                updates['status'] = status
             
-            if asset:
-                print(f"Current: {asset}")
-                battery_health = input("New Battery Health (or Enter to skip): ")
-                status = input("New Status (or Enter to skip): ")
-                
-                updates = {}
-                if battery_health:
-                    updates['battery_health'] = int(battery_health)
-                if status:
-                    updates['status'] = status
-                
-                inventory.update_asset(asset_id, **updates)
-            else:
-                print(f"Asset {asset_id} not found.")
-        
-        elif choice == "5":
-            asset_id = input("\nEnter Asset ID to delete: ")
-            inventory.delete_asset(asset_id)
-        
-        elif choice == "6":
-            print("\n--- AI Procurement Prevention Check ---")
-            device_name = input("Device Name to purchase: ")
-            device_category = input("Device Category: ")
-            inventory.check_procurement_prevention(device_name, device_category)
-        
-        elif choice == "7":
-            inventory.show_marketplace()
-        
-        elif choice == "8":
-            inventory.generate_migration_report()
+            inventory.update_asset(asset_id, **updates)
+        else:
+            print(f"Asset {asset_id} not found.")
+    
+    def delete_asset():
+        asset_id = input("\nEnter Asset ID to delete: ")
+        inventory.delete_asset(asset_id)
+    
+    def check_procurement():
+        print("\n--- AI Procurement Prevention Check ---")
+        device_name = input("Device Name to purchase: ")
+        device_category = input("Device Category: ")
+        inventory.check_procurement_prevention(device_name, device_category)
+    
+    def export_inventory():
+        filename = input("Enter filename (default: inventory.json): ") or "inventory.json"
+        inventory.export_to_json(filename)
+    
+    def exit_menu():
+        print("\nExiting system. Thank you!")
+        return True
+    
+    def invalid_choice():
+        print("Invalid choice. Please try again.")
+    
+    # Menu choice -> handler; a handler returning True ends the session
+    handlers = {
+        "1": add_asset,
+        "2": inventory.list_all_assets,
+        "3": search_assets,
+        "4": update_asset,
+        "5": delete_asset,
+        "6": check_procurement,
+        "7": inventory.show_marketplace,
+        "8": inventory.generate_migration_report,
+        "9": export_inventory,
+        "10": exit_menu,
+    }
+    
+    while True:
+        print(MAIN_MENU)
         
-        elif choice == "9":
-            filename = input("Enter filename (default: inventory.json): ") or "inventory.json"
-            inventory.export_to_json(filename)
+        choice = input("\nEnter your choice (1-10): ").strip()
         
-        elif choice == "10":
-            print("\nExiting system. Thank you!")
+        if handlers.get(choice, invalid_choice)():
             break
-        
-        else:
-            print("Invalid choice. Please try again.")
 
 
 # Demo execution